@@ -10,7 +10,7 @@ base class over the original APISession class.
     :members:
     :inherited-members:
 '''
-from typing import Any, List, Optional
+from typing import Any, Container, Optional
 from restfly.utils import check
 from restfly import APIEndpoint as Base
 
@@ -24,7 +24,7 @@ class APIEndpoint(Base):  # noqa PLR0903
                name: str,
                obj: Any,
                expected_type: Any,
-               choices: Optional[List] = None,
+               choices: Optional[Container] = None,
                default: Optional[Any] = None,
                case: Optional[str] = None,
                pattern: Optional[str] = None
@@ -40,8 +40,9 @@ class APIEndpoint(Base):  # noqa PLR0903
                 The object to check.
             expected_type (Any):
                 The object type to check against
-            choices (optional, list[Any]):
-                A list of valid values that `obj` must be.
+            choices (optional, Container[Any]):
+                A list (or any other container, such as a frozenset) of valid
+                values that `obj` must be.
             default (optional, Any):
                 The default value to return if the `obj` is `None`.
             case (optional, str):
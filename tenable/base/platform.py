@@ -12,6 +12,7 @@ base class over the original APISession class.
 '''
 import os
 import warnings
+from requests.adapters import HTTPAdapter
 from restfly import APISession as Base
 from tenable.errors import AuthenticationWarning
 from tenable.utils import url_validator
@@ -77,6 +78,8 @@ class APIPlatform(Base):
     _env_base = ''
     _auth = {}
     _auth_mech = None
+    _pool_connections = 10
+    _pool_maxsize = 20
 
     def __init__(self, **kwargs):
 
@@ -101,6 +104,26 @@ class APIPlatform(Base):
         # Call the RESTfly constructor
         super().__init__(**kwargs)
 
+    def _build_session(self, **kwargs):
+        '''
+        Session builder overload to ensure that a connection-pooling adapter is
+        mounted when the caller hasn't supplied their own session or adapter.
+        '''
+        super()._build_session(**kwargs)
+
+        # The requests session already keeps connections alive and pools them
+        # using its default adapter (10 pools of 10 connections each).  As
+        # the threaded helpers may run more requests concurrently than that,
+        # we mount an adapter with a larger per-host pool so that those
+        # connections are kept for re-use instead of being discarded.
+        if not kwargs.get('session') and not kwargs.get('adapter'):
+            adapter = HTTPAdapter(pool_connections=self._pool_connections,
+                                  pool_maxsize=self._pool_maxsize,
+                                  pool_block=False
+                                  )
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+
     def _session_auth(self, username, password):
         '''
         Default Session auth behavior
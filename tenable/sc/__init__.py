@@ -47,8 +47,9 @@ Tenable.sc
 '''
 import warnings
 from typing import Optional
+from restfly.utils import check
 from semver import VersionInfo
-from tenable.errors import APIError, ConnectionError
+from tenable.errors import APIError, ConnectionError, UnexpectedValueError
 from tenable.base.platform import APIPlatform
 from .accept_risks import AcceptRiskAPI
 from .alerts import AlertAPI
@@ -89,6 +90,9 @@ class TenableSC(APIPlatform):  # noqa PLR0904
             in future releases).
         access_key (str, optional):
             The API access key to use for sessionless authentication.
+        alert_max_inflight (int, optional):
+            The maximum number of alert create and edit calls that may be
+            in-flight concurrently.  The default is ``8``.
         adapter (requests.Adaptor, optional):
             If a requests session adaptor is needed to ensure connectivity
             to the Tenable.sc host, one can be provided here.
@@ -204,6 +208,21 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         if secret_key:
             kwargs['secret_key'] = secret_key
 
+        # The endpoint interface objects are constructed on first access and
+        # re-used until the next login or logout, so any state an endpoint
+        # holds (such as the alert response cache) is scoped to the session.
+        # This needs to exist before authentication, as key auth will call
+        # the system API.
+        self._endpoints = {}
+
+        # Validate the alert in-flight limit now so that a bad value fails
+        # when the client is built rather than on first use of sc.alerts.
+        self._alert_max_inflight = check(
+            'alert_max_inflight', kwargs.pop('alert_max_inflight', None), int)
+        if (self._alert_max_inflight is not None
+                and self._alert_max_inflight < 1):
+            raise UnexpectedValueError('alert_max_inflight must be at least 1')
+
         # Now lets pass the relevant parts off to the APISession's constructor
         # to make sure we have everything lined up as we expect.
         super().__init__(**kwargs)
@@ -214,14 +233,33 @@ class TenableSC(APIPlatform):  # noqa PLR0904
     def __exit__(self, exc_type, exc_value, exc_traceback):
         self.logout()
 
+    def _get_endpoint(self, endpoint, **kwargs):
+        '''
+        Returns the cached interface object for the endpoint class, building
+        it (with any keyword arguments passed) if this is the first time it
+        has been requested.
+        '''
+        obj = self._endpoints.get(endpoint)
+        if obj is None:
+            # If two threads race to build the same endpoint, setdefault
+            # ensures that only the first stored object is ever handed out.
+            obj = self._endpoints.setdefault(endpoint,
+                                             endpoint(self, **kwargs))
+        return obj
+
     def _resp_error_check(self, response, **kwargs):
         if not kwargs.get('stream', False):
             try:
                 data = response.json()
-                if data['error_code']:
-                    raise APIError(response)
             except ValueError:
                 pass
+            else:
+                # The decoded body is stored on the response so that endpoints
+                # can read it through SCEndpoint._response_body instead of
+                # decoding the same payload a second time.
+                response.sc_body = data
+                if data['error_code']:
+                    raise APIError(response)
         return response
 
     def _key_auth(self, access_key, secret_key):
@@ -254,6 +292,10 @@ class TenableSC(APIPlatform):  # noqa PLR0904
     def _deauthenticate(self):  # noqa PLW0221
         super()._deauthenticate(path='token')
 
+        # Drop the endpoint objects, as any state they hold (such as the
+        # alert response cache) belongs to the user that was logged in.
+        self._endpoints.clear()
+
     def login(self, username=None, password=None,
               access_key=None, secret_key=None):
         '''
@@ -280,6 +322,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
             >>> sc = TenableSC('127.0.0.1', port=8443)
             >>> sc.login(access_key='ACCESSKEY', secret_key='SECRETKEY')
         '''
+        self._endpoints.clear()
         self._authenticate(**{
             'username': username,
             'password': password,
@@ -316,7 +359,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Accept Risks APIs <accept_risks>`.
         '''
-        return AcceptRiskAPI(self)
+        return self._get_endpoint(AcceptRiskAPI)
 
     @property
     def alerts(self):
@@ -324,7 +367,8 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Alerts APIs <alerts>`.
         '''
-        return AlertAPI(self)
+        return self._get_endpoint(AlertAPI,
+                                  max_inflight=self._alert_max_inflight)
 
     @property
     def analysis(self):
@@ -332,7 +376,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Analysis APIs <analysis>`.
         '''
-        return AnalysisAPI(self)
+        return self._get_endpoint(AnalysisAPI)
 
     @property
     def asset_lists(self):
@@ -340,7 +384,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Asset Lists APIs <asset_lists>`.
         '''
-        return AssetListAPI(self)
+        return self._get_endpoint(AssetListAPI)
 
     @property
     def audit_files(self):
@@ -348,7 +392,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Audit Files APIs <audit_files>`.
         '''
-        return AuditFileAPI(self)
+        return self._get_endpoint(AuditFileAPI)
 
     @property
     def credentials(self):
@@ -356,7 +400,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Credentials APIs <credentials>`.
         '''
-        return CredentialAPI(self)
+        return self._get_endpoint(CredentialAPI)
 
     @property
     def current(self):
@@ -364,7 +408,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Current Session APIs <current>`.
         '''
-        return CurrentSessionAPI(self)
+        return self._get_endpoint(CurrentSessionAPI)
 
     @property
     def feeds(self):
@@ -372,7 +416,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Feeds APIs <feeds>`.
         '''
-        return FeedAPI(self)
+        return self._get_endpoint(FeedAPI)
 
     @property
     def files(self):
@@ -380,7 +424,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Files APIs <files>`.
         '''
-        return FileAPI(self)
+        return self._get_endpoint(FileAPI)
 
     @property
     def groups(self):
@@ -388,7 +432,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Groups APIs <groups>`.
         '''
-        return GroupAPI(self)
+        return self._get_endpoint(GroupAPI)
 
     @property
     def organizations(self):
@@ -396,7 +440,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Organization APIs <organizations>`.
         '''
-        return OrganizationAPI(self)
+        return self._get_endpoint(OrganizationAPI)
 
     @property
     def plugins(self):
@@ -404,7 +448,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Plugins APIs <plugins>`.
         '''
-        return PluginAPI(self)
+        return self._get_endpoint(PluginAPI)
 
     @property
     def policies(self):
@@ -412,7 +456,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Policies APIs <policies>`.
         '''
-        return ScanPolicyAPI(self)
+        return self._get_endpoint(ScanPolicyAPI)
 
     @property
     def queries(self):
@@ -420,7 +464,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Queries APIs <queries>`.
         '''
-        return QueryAPI(self)
+        return self._get_endpoint(QueryAPI)
 
     @property
     def recast_risks(self):
@@ -428,7 +472,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Recast Risks APIs <recast_risks>`.
         '''
-        return RecastRiskAPI(self)
+        return self._get_endpoint(RecastRiskAPI)
 
     @property
     def repositories(self):
@@ -436,7 +480,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Repositories APIs <repositories>`.
         '''
-        return RepositoryAPI(self)
+        return self._get_endpoint(RepositoryAPI)
 
     @property
     def roles(self):
@@ -444,7 +488,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Roles APIs <roles>`.
         '''
-        return RoleAPI(self)
+        return self._get_endpoint(RoleAPI)
 
     @property
     def scanners(self):
@@ -452,7 +496,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Scanners APIs <scanners>`.
         '''
-        return ScannerAPI(self)
+        return self._get_endpoint(ScannerAPI)
 
     @property
     def scans(self):
@@ -460,7 +504,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Scans APIs <scans>`.
         '''
-        return ScanAPI(self)
+        return self._get_endpoint(ScanAPI)
 
     @property
     def scan_instances(self):
@@ -468,7 +512,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Scan Instances APIs <scan_instances>`.
         '''
-        return ScanResultAPI(self)
+        return self._get_endpoint(ScanResultAPI)
 
     @property
     def scan_zones(self):
@@ -476,7 +520,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Scan Zones APIs <scan_zones>`.
         '''
-        return ScanZoneAPI(self)
+        return self._get_endpoint(ScanZoneAPI)
 
     @property
     def status(self):
@@ -484,7 +528,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Status APIs <status>`.
         '''
-        return StatusAPI(self)
+        return self._get_endpoint(StatusAPI)
 
     @property
     def system(self):
@@ -492,7 +536,7 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc System APIs <system>`.
         '''
-        return SystemAPI(self)
+        return self._get_endpoint(SystemAPI)
 
     @property
     def users(self):
@@ -500,4 +544,4 @@ class TenableSC(APIPlatform):  # noqa PLR0904
         The interface object for the
         :doc:`Tenable.sc Users APIs <users>`.
         '''
-        return UserAPI(self)
+        return self._get_endpoint(UserAPI)
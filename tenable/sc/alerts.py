@@ -16,16 +16,231 @@ Methods available on ``sc.alerts``:
 .. _iCal Recurrence Rule:
     https://tools.ietf.org/html/rfc5545#section-3.3.10
 '''
-from .base import SCEndpoint
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from threading import BoundedSemaphore, Lock
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+from restfly.utils import check
+from .base import SCEndpoint, SCResultsIterator
+from tenable.errors import (APIError, PackageMissingError,
+                            UnexpectedValueError)
 from tenable.utils import dict_merge
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_body(payload):
+    '''
+    Serializes the payload into the JSON request body.  If the orjson package
+    is installed, it will be used as it is considerably faster than the
+    standard library for larger documents.  Both paths convert non-string
+    keys into strings.  NaN and Infinity values are rejected with a
+    ValueError by the standard library path (as requests does), whereas
+    orjson will write them as ``null``.
+    '''
+    if orjson:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, allow_nan=False).encode('utf-8')
+
+
+@lru_cache(maxsize=128)
+def _join_fields(fields):
+    '''
+    Validates and joins the tuple of field names into the comma-separated
+    string that the API expects.  As the same field lists tend to be sent on
+    every call (and every page), the joined result is cached.
+    '''
+    validated = []
+    append = validated.append
+    for f in fields:
+        append(check('field', f, str))
+    return ','.join(validated)
+
+
+class AlertResultsIterator(SCResultsIterator):
+    '''
+    Iterates over the manageable alerts a page at a time.
+    '''
+    def _page_records(self, resp):
+        '''
+        Unlike most of the list responses, the alert list is split into the
+        usable and manageable alerts, so we will be walking the manageable
+        list.
+        '''
+        return resp['response'].get('manageable', [])
+
+
 class AlertAPI(SCEndpoint):
+    '''
+    Args:
+        max_inflight (int, optional):
+            The maximum number of alert create and edit calls that may be
+            in-flight concurrently.  Must be at least ``1``.  The default is
+            ``8``.  A call that can't get a free slot within 300 seconds
+            raises a ``TimeoutError``.
+    '''
+    __slots__ = ('_cache', '_cache_lock', '_inflight')
+
+    # The (key, type, choices) definitions for the attributes within the alert
+    # document that only require a simple type check.
+    _FIELD_SCHEMA = (
+        ('name', str, None),
+        ('description', str, None),
+    )
+
+    # The supported trigger operators.
+    _TRIGGER_OPS = frozenset({'>=', '<=', '=', '!='})
+
+    # The (key, type) definitions for the attributes within each of the
+    # supported alert action types.
+    _ACTION_SCHEMAS = {
+        'email': (
+            ('subject', str),
+            ('message', str),
+            ('addresses', str),
+            ('users', list),
+            ('includeResults', str),
+        ),
+        'notification': (
+            ('message', str),
+            ('users', list),
+        ),
+        'report': (
+            ('report', dict),
+        ),
+        'scan': (
+            ('scan', dict),
+        ),
+        'syslog': (
+            ('host', str),
+            ('port', str),
+            ('message', str),
+            ('severity', str),
+        ),
+        'ticket': (
+            ('assignee', dict),
+            ('name', str),
+            ('description', str),
+            ('notes', str),
+        ),
+    }
+
+    # The maximum number of responses to hold within the conditional GET
+    # cache.
+    _cache_size = 128
+
+    # The maximum number of create & edit calls that may be in-flight at any
+    # given time, and how long (in seconds) a call will wait for a free slot.
+    _max_inflight = 8
+    _inflight_timeout = 300
+
+    def __init__(self, api, max_inflight=None):
+        super().__init__(api)
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
+
+        # Bulk imports of alerts can easily overwhelm Tenable.sc, so we will
+        # bound the number of concurrent mutating calls.  Retries with backoff
+        # on 429 and 5xx responses are already handled within the session.
+        max_inflight = self._check('max_inflight', max_inflight, int,
+                                   default=self._max_inflight)
+        if max_inflight < 1:
+            raise UnexpectedValueError('max_inflight must be at least 1')
+        self._inflight = BoundedSemaphore(max_inflight)
+
+    @contextmanager
+    def _inflight_slot(self):
+        '''
+        Holds one of the in-flight slots for the duration of the context.  If
+        no slot frees up within the in-flight timeout, then a TimeoutError is
+        raised.
+        '''
+        if not self._inflight.acquire(timeout=self._inflight_timeout):
+            raise TimeoutError('Timed out waiting for an in-flight alert '
+                               'create/edit slot to free up')
+        try:
+            yield
+        finally:
+            self._inflight.release()
+
+    def _cached_get(self, path, params):
+        '''
+        Performs a conditional GET against the path.  If an ETag or
+        Last-Modified header was returned the last time this path and params
+        were requested, then the request will be sent with the matching
+        validator, and a 304 response will return the previously returned
+        response.  If the request fails due to a connection error, then the
+        stale response will be returned instead (if we have one).  The raw
+        response body is what is cached, and it's decoded on every hit so
+        that each caller gets its own copy.
+        '''
+        key = (path, frozenset(params.items()) if params else None)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['modified']:
+                headers['If-Modified-Since'] = cached['modified']
+
+        try:
+            resp = self._api.get(path, params=params, headers=headers)
+        except (RequestsConnectionError, Timeout) as err:
+            if not cached:
+                raise
+            self._log.warning(
+                f'Returning stale response for {path} due to error: {err}')
+            return json.loads(cached['content'])['response']
+        except APIError as err:
+            # RESTfly only returns 2xx responses, so a 304 Not Modified will
+            # be raised as an APIError.  If we have a cached copy, then this
+            # is exactly what we were looking for.
+            if not (cached and err.response is not None
+                    and err.response.status_code == 304):
+                raise
+            with self._cache_lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+            return json.loads(cached['content'])['response']
+
+        response = self._response_body(resp)['response']
+        etag = resp.headers.get('ETag')
+        modified = resp.headers.get('Last-Modified')
+
+        # Only responses that can be validated later on are stored.  As the
+        # caller is free to modify what we return, we store the raw body
+        # rather than the decoded response.  The oldest entries are evicted
+        # when the cache is full.
+        if etag or modified:
+            with self._cache_lock:
+                self._cache[key] = {
+                    'etag': etag,
+                    'modified': modified,
+                    'content': resp.content
+                }
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return response
+
     def _constructor(self, *filters, **kw):
         '''
         Handles building an alert document.
         '''
 
-        # call the analysis query constructor to assemble a query.
+        # call the analysis query constructor to assemble a query.  If the
+        # query document is being built by us, then there isn't any need to
+        # re-validate it afterwards.
+        query_built = len(filters) > 0 and 'query' not in kw
         if len(filters) > 0:
             # checking to see if data_type was passed.  If it wasn't then we
             # will set the value to the default of 'vuln'.
@@ -40,14 +255,13 @@ class AlertAPI(SCEndpoint):
         elif 'query_id' in kw:
             kw = self._query_constructor(*filters, **kw)
 
-        if 'name' in kw:
-            kw['name'] = self._check('name', kw['name'], str)
-
-        if 'description' in kw:
-            kw['description'] = self._check(
-                'description', kw['description'], str)
+        # validate the simple pass-through attributes against the field
+        # schema table.
+        for key, typ, choices in self._FIELD_SCHEMA:
+            if key in kw:
+                kw[key] = self._check(key, kw[key], typ, choices=choices)
 
-        if 'query' in kw:
+        if 'query' in kw and not query_built:
             kw['query'] = self._check('query', kw['query'], dict)
 
         if 'always_exec_on_trigger' in kw:
@@ -55,33 +269,40 @@ class AlertAPI(SCEndpoint):
             # string.  We will accept a boolean and then transform it into a
             # string value.
             kw['executeOnEveryTrigger'] = str(self._check(
-                'always_exec_on_trigger', kw['always_exec_on_trigger'], bool)).lower()
-            del(kw['always_exec_on_trigger'])
+                'always_exec_on_trigger', kw.pop('always_exec_on_trigger'),
+                bool)).lower()
 
         if 'trigger' in kw:
             # here we will be expanding the trigger from the common format of
             # tuples that we are using within pytenable into the native
             # supported format that SecurityCenter expects.
-            self._check('trigger', kw['trigger'], tuple)
-            kw['triggerName'] = self._check(
-                'triggerName', kw['trigger'][0], str)
+            trigger = self._check('trigger', kw.pop('trigger'), tuple)
+            kw['triggerName'] = self._check('triggerName', trigger[0], str)
             kw['triggerOperator'] = self._check(
-                'triggerOperator', kw['trigger'][1], str,
-                choices=['>=', '<=', '=', '!='])
-            kw['triggerValue'] = self._check(
-                'triggerValue', kw['trigger'][2], str)
-            del(kw['trigger'])
+                'triggerOperator', trigger[1], str, choices=self._TRIGGER_OPS)
+            kw['triggerValue'] = self._check('triggerValue', trigger[2], str)
 
         # hand off the building the schedule sub-document to the schedule
         # document builder.
         if 'schedule' in kw:
             kw['schedule'] = self._schedule_constructor(kw['schedule'])
 
-        # FR: at some point we should start looking into checking and
-        #     normalizing the action document.
+        if 'action' in kw:
+            # validate each of the action documents against the attribute
+            # definitions for that action type.
+            for action in self._check('action', kw['action'], list):
+                self._check('action', action, dict)
+                if 'type' not in action:
+                    raise UnexpectedValueError(
+                        'action documents must specify a type')
+                schema = self._ACTION_SCHEMAS[self._check('action:type',
+                    action['type'], str, choices=self._ACTION_SCHEMAS)]
+                for key, typ in schema:
+                    if key in action:
+                        self._check(f'action:{key}', action[key], typ)
         return kw
 
-    def list(self, fields=None):
+    def list(self, fields=None, limit=None, offset=0, pages=None):
         '''
         Retrieves the list of alerts.
 
@@ -90,21 +311,112 @@ class AlertAPI(SCEndpoint):
         Args:
             fields (list, optional):
                 A list of attributes to return for each alert.
+            limit (int, optional):
+                How many records should be returned in each page of data.  If
+                a limit is specified, then the manageable alerts will be
+                returned through a paginated iterator instead of returning the
+                whole alert list in one response.  Note that the paginated
+                iterator only returns the manageable alerts; the usable alerts
+                are not included.
+            offset (int, optional):
+                At what offset within the data should we start returning data.
+                Only used when ``limit`` is specified.  If none is specified,
+                the default is 0.
+            pages (int, optional):
+                How many pages of data should we return.  Only used when
+                ``limit`` is specified.  If none is specified then all pages
+                will return.
 
         Returns:
-            :obj:`dict`:
-                A list of alert resources.
+            :obj:`dict` or :obj:`AlertResultsIterator`:
+                A list of alert resources, or an iterator object handling data
+                pagination if a ``limit`` was specified.
 
         Examples:
             >>> for alert in sc.alerts.list()['manageable']:
             ...     pprint(alert)
+
+            Walking the manageable alerts 100 at a time:
+
+            >>> for alert in sc.alerts.list(limit=100):
+            ...     pprint(alert)
+        '''
+        params = {'fields': _join_fields(tuple(fields))} if fields else None
+
+        if limit is not None:
+            return AlertResultsIterator(self._api,
+                _resource='alert',
+                _offset=self._check('offset', offset, int),
+                _limit=self._check('limit', limit, int),
+                _query=params or {},
+                _pages_total=self._check('pages', pages, int))
+
+        return self._cached_get('alert', params)
+
+    def iter_list(self, fields=None):
+        '''
+        Iterates over the manageable alerts, decoding each alert as it's read
+        off of the wire instead of loading the whole response into memory.
+        This method requires that the `ijson`_ package be installed.
+
+        :sc-api:`alert: list <Alert.html#AlertRESTReference-/alert>`
+
+        Args:
+            fields (list, optional):
+                A list of attributes to return for each alert.
+
+        Returns:
+            :obj:`generator`:
+                A generator yielding each manageable alert resource.
+
+        Raises:
+            PackageMissingError:
+                If the ijson package isn't installed.  This is raised when
+                iter_list is called, not when the generator is first consumed.
+            APIError:
+                If Tenable.sc returned an error within the response body.
+
+        Examples:
+            >>> for alert in sc.alerts.iter_list():
+            ...     pprint(alert)
+
+        .. _ijson:
+            https://pypi.org/project/ijson/
         '''
-        params = dict()
-        if fields:
-            params['fields'] = ','.join([self._check('field', f, str)
-                for f in fields])
+        try:
+            import ijson
+        except ImportError:
+            raise PackageMissingError(
+                'The python package ijson is required for iter_list')
 
-        return self._api.get('alert', params=params).json()['response']
+        params = {'fields': _join_fields(tuple(fields))} if fields else None
+        return self._stream_alerts(ijson, params)
+
+    def _stream_alerts(self, ijson, params):
+        '''
+        Streams the alert list response, yielding each manageable alert as it
+        has been decoded.  As streamed responses bypass the session's error
+        checking, the error_code within the body is checked here.
+        '''
+        item = 'response.manageable.item'
+        with self._api.get('alert', params=params, stream=True) as resp:
+            resp.raw.decode_content = True
+            builder = None
+            for prefix, event, value in ijson.parse(resp.raw,
+                                                    use_float=True):
+                if prefix == 'error_code' and value:
+                    raise APIError(resp)
+
+                # When we see the start of a new alert, we will start building
+                # it and feed it every event until we reach the end of the
+                # alert, at which point it can be handed back to the caller.
+                if builder is None and prefix == item and event == 'start_map':
+                    builder = ijson.ObjectBuilder()
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == item and event == 'end_map':
+                        yield builder.value
+                        builder = None
 
     def details(self, id, fields=None):
         '''
@@ -124,12 +436,47 @@ class AlertAPI(SCEndpoint):
             >>> alert = sc.alerts.detail(1)
             >>> pprint(alert)
         '''
-        params = dict()
-        if fields:
-            params['fields'] = ','.join([self._check('field', f, str) for f in fields])
+        params = {'fields': _join_fields(tuple(fields))} if fields else None
+
+        return self._cached_get(f'alert/{self._check("id", id, int)}', params)
+
+    def _check_ids(self, ids):
+        '''
+        Validates that the ids are a list of integer alert identifiers.
+        '''
+        return [self._check('id', i, int)
+                for i in self._check('ids', ids, list)]
+
+    def details_many(self, ids, fields=None, num_threads=10):
+        '''
+        Returns the details for multiple alerts.  The detail calls are issued
+        concurrently over the shared session instead of one after another.
+
+        :sc-api:`alert: details <Alert.html#AlertRESTReference-/alert/{id}>`
+
+        Args:
+            ids (list): The list of alert identifiers.
+            fields (list, optional): A list of attributes to return.
+            num_threads (int, optional):
+                How many concurrent requests should be made.  The default is
+                ``10``.
 
-        return self._api.get('alert/{}'.format(self._check('id', id, int)),
-            params=params).json()['response']
+        Returns:
+            :obj:`list`:
+                The alert resource records in the same order as the ids.
+
+        Examples:
+            >>> for alert in sc.alerts.details_many([1, 2, 3]):
+            ...     pprint(alert)
+        '''
+        # validate all of the ids before we schedule anything so that a bad
+        # id doesn't leave us with a partially processed set.
+        ids = self._check_ids(ids)
+        num_threads = self._check('num_threads', num_threads, int)
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            return list(executor.map(
+                lambda i: self.details(i, fields=fields), ids))
 
     def create(self, *filters, **kw):
         '''
@@ -240,7 +587,11 @@ class AlertAPI(SCEndpoint):
             ...     }])
         '''
         payload = self._constructor(*filters, **kw)
-        return self._api.post('alert', json=payload).json()['response']
+        with self._inflight_slot():
+            resp = self._api.post('alert',
+                data=_json_body(payload),
+                headers={'Content-Type': 'application/json'})
+        return self._response_body(resp)['response']
 
     def edit(self, id, *filters, **kw):
         '''
@@ -286,8 +637,11 @@ class AlertAPI(SCEndpoint):
             >>> sc.alerts.update(1, name='New Alert Name')
         '''
         payload = self._constructor(*filters, **kw)
-        return self._api.patch('alert/{}'.format(
-            self._check('id', id, int)), json=payload).json()['response']
+        with self._inflight_slot():
+            resp = self._api.patch(f'alert/{self._check("id", id, int)}',
+                data=_json_body(payload),
+                headers={'Content-Type': 'application/json'})
+        return self._response_body(resp)['response']
 
     def delete(self, id):
         '''
@@ -305,8 +659,8 @@ class AlertAPI(SCEndpoint):
         Examples:
             >>> sc.alerts.delete(1)
         '''
-        return self._api.delete('alert/{}'.format(
-            self._check('id', id, int))).json()['response']
+        resp = self._api.delete(f'alert/{self._check("id", id, int)}')
+        return self._response_body(resp)['response']
 
     def execute(self, id):
         '''
@@ -321,5 +675,46 @@ class AlertAPI(SCEndpoint):
             :obj:`dict`:
                 The alert resource.
         '''
-        return self._api.post('alert/{}/execute'.format(
-            self._check('id', id, int))).json()['response']
+        resp = self._api.post(f'alert/{self._check("id", id, int)}/execute')
+        return self._response_body(resp)['response']
+
+    def execute_many(self, ids, num_threads=10):
+        '''
+        Executes multiple alerts.  The execute calls are issued concurrently,
+        and a failure of one alert will not prevent the others from being
+        executed.
+
+        :sc-api:`alert: execute <Alert.html#AlertRESTReference-/alert/{id}/execute>`
+
+        Args:
+            ids (list): The list of alert identifiers.
+            num_threads (int, optional):
+                How many concurrent requests should be made.  The default is
+                ``10``.
+
+        Returns:
+            :obj:`list`:
+                A result record for each alert id, in the same order as the
+                ids.  Each record contains the ``id``, the ``status`` (either
+                ``success`` or ``error``), and either the alert ``response`` or
+                the ``error`` message.
+
+        Examples:
+            >>> for result in sc.alerts.execute_many([1, 2, 3]):
+            ...     pprint(result)
+        '''
+        ids = self._check_ids(ids)
+        num_threads = self._check('num_threads', num_threads, int)
+
+        def run(alert_id):
+            try:
+                return {
+                    'id': alert_id,
+                    'status': 'success',
+                    'response': self.execute(alert_id)
+                }
+            except (APIError, RequestsConnectionError, Timeout) as err:
+                return {'id': alert_id, 'status': 'error', 'error': str(err)}
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            return list(executor.map(run, ids))
@@ -75,7 +75,7 @@ Methods available on ``sc.analysis``:
 .. autoclass:: AnalysisAPI
     :members:
 '''
-from .base import SCEndpoint, SCResultsIterator
+from .base import SCEndpoint, SCResultsIterator, response_body
 from tenable.utils import dict_merge
 from tenable.errors import UnexpectedValueError
 
@@ -98,7 +98,7 @@ class AnalysisResultsIterator(SCResultsIterator):
         query['query']['endOffset'] = self._limit + self._offset
 
         # Lets actually call the API for the data at this point.
-        resp = self._api.post('analysis', json=query).json()
+        resp = response_body(self._api.post('analysis', json=query))
 
         # Now that we have the response, lets reset any counters we need to,
         # and increment things like the page counter, offset, etc.
@@ -80,7 +80,39 @@ converting more human-readable text into recurrence rules, such as the
 from tenable.base.endpoint import APIEndpoint
 from tenable.base.v1 import APIResultsIterator
 
+
+def response_body(resp):
+    '''
+    Returns the decoded JSON body of the response.  If the body was already
+    decoded when the response was checked for errors, then that decoded body
+    will be returned instead of decoding it again.
+
+    Args:
+        resp (requests.Response): The response object.
+
+    Returns:
+        :obj:`dict`:
+            The decoded response body.
+    '''
+    body = getattr(resp, 'sc_body', None)
+    if body is None:
+        body = resp.json()
+    return body
+
+
 class SCEndpoint(APIEndpoint):
+    # The supported schedule document types.
+    _SCHEDULE_TYPES = frozenset({
+        'ical', 'dependent', 'never', 'rollover', 'template', 'now'
+    })
+
+    def _response_body(self, resp):
+        '''
+        Returns the decoded JSON body of the response.  Refer to
+        :func:`response_body` for details.
+        '''
+        return response_body(resp)
+
     def _combo_expansion(self, item):
         '''
         Expands the asset combination expressions from nested tuples to the
@@ -223,8 +255,7 @@ class SCEndpoint(APIEndpoint):
         '''
         self._check('schedule:item', item, dict)
         item['type'] = self._check('schedule:type',  item.get('type'), str,
-            choices=['ical', 'dependent', 'never', 'rollover', 'template', 'now'],
-            default='never')
+            choices=self._SCHEDULE_TYPES, default='never')
         if item['type'] == 'ical':
             self._check('schedule:start', item.get('start'), str)
             self._check('schedule:repeatRule', item.get('repeatRule'), str)
@@ -233,6 +264,14 @@ class SCEndpoint(APIEndpoint):
         return item
 
 class SCResultsIterator(APIResultsIterator):
+    def _page_records(self, resp):
+        '''
+        Returns the list of records within the response.  Iterators for
+        resources that nest the records further within the response should
+        overload this method.
+        '''
+        return resp['response']
+
     def _get_page(self):
         '''
         Retrieves the next page of results when the current page has been
@@ -251,7 +290,8 @@ class SCResultsIterator(APIResultsIterator):
         query['endOffset'] = self._limit + self._offset
 
         # Lets actually call the API for the data at this point.
-        resp = self._api.get(self._resource, params=query).json()
+        resp = response_body(
+            self._api.get(self._resource, params=query))
 
         # Now that we have the response, lets reset any counters we need to,
         # and increment things like the page counter, offset, etc.
@@ -259,13 +299,13 @@ class SCResultsIterator(APIResultsIterator):
         self._pages_requested += 1
         self._offset += self._limit
         self._raw = resp
-        self.page = resp['response']
+        self.page = self._page_records(resp)
 
         # As no total is returned via the API, we will simply need to re-compute
         # the total to be N+1 every page as long as the page of data is equal to
         # the limit.  If we ever get a page of data that is less than the limit,
         # then we will set the total to be the count + page length.
-        if len(resp['response']) < self._limit:
-            self.total = self.count + len(resp['response'])
+        if len(self.page) < self._limit:
+            self.total = self.count + len(self.page)
         else:
             self.total = self.count + self._limit + 1
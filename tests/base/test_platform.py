@@ -3,6 +3,7 @@ Base platform Testing module.
 '''
 import pytest
 import responses
+from requests import Session
 from tenable.base.platform import APIPlatform
 
 
@@ -77,3 +78,27 @@ def test_camel_squashing():
                        box=True
                        )
     assert api1.get('example').camelCase == api2.get('example').camel_case
+
+
+def test_session_pooling():
+    '''
+    Test that a pooled adapter is mounted onto the session.
+    '''
+    api = APIPlatform(url='https://localhost',
+                      access_key='1',
+                      secret_key='2'
+                      )
+    for url in ['https://localhost', 'http://localhost']:
+        pool = api._session.get_adapter(url).poolmanager  # noqa: PLW0212
+        assert pool.connection_pool_kw['maxsize'] == 20
+        assert pool.connection_pool_kw['block'] is False
+
+    # A user-supplied session should be left untouched.
+    session = Session()
+    api = APIPlatform(url='https://localhost',
+                      access_key='1',
+                      secret_key='2',
+                      session=session
+                      )
+    pool = session.get_adapter('https://localhost').poolmanager
+    assert pool.connection_pool_kw['maxsize'] == 10
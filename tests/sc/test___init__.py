@@ -2,6 +2,7 @@
 test file to test various scenarios in init.py
 '''
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from requests.models import Response
@@ -9,6 +10,7 @@ from requests.models import Response
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from tenable.errors import ConnectionError
 from tenable.sc import TenableSC
+from tenable.sc.base import response_body
 
 
 def test_init_connection_error():
@@ -65,6 +67,43 @@ def test_resp_error_check(security_center):
     security_center._resp_error_check(response)
 
 
+def test_resp_error_check_body(security_center):
+    '''
+    test response error check stores the decoded body for the endpoints
+    '''
+    response = Response()
+    response._content = b'{"error_code": 0, "response": {"id": "1"}}'
+    security_center._resp_error_check(response)
+    assert response.sc_body == {'error_code': 0, 'response': {'id': '1'}}
+    assert response.json() is not response.sc_body
+    assert security_center.alerts._response_body(response) is response.sc_body
+    assert response_body(response) is response.sc_body
+
+    # without a stored body, the response is decoded.
+    response = Response()
+    response._content = b'{"error_code": 0}'
+    assert response_body(response) == {'error_code': 0}
+
+
+def test_endpoint_caching(security_center):
+    '''
+    test that the endpoint interfaces are only constructed once
+    '''
+    assert security_center.alerts is security_center.alerts
+    assert security_center.alerts._api is security_center
+
+
+def test_endpoint_caching_threaded():
+    '''
+    test that concurrent first accesses all get the same endpoint object
+    '''
+    tsc = TenableSC(url='https://localhost')
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        alerts = list(executor.map(lambda _: tsc.alerts, range(32)))
+    assert all(a is alerts[0] for a in alerts)
+    assert alerts[0] is tsc.alerts
+
+
 def test_log_in(vcr):
     '''
     test log in
@@ -1,10 +1,17 @@
 '''
 test file to test various scenarios in sc alerts
 '''
+import json
+
 import pytest
+import responses
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from tenable.errors import APIError, UnexpectedValueError
 from tests.pytenable_log_handler import log_exception
+from tenable.sc import TenableSC
+from tenable.sc import alerts as alerts_module
+from tenable.sc.alerts import AlertAPI, _join_fields, _json_body
 from ..checker import check
 
 
@@ -106,6 +113,31 @@ def test_alerts_constructor_trigger_value_typeerror(security_center):
         security_center.alerts._constructor(trigger=('name', '=', 1))
 
 
+def test_alerts_constructor_action_typeerror(security_center):
+    '''
+    test alerts constructor for action type error
+    '''
+    with pytest.raises(TypeError):
+        security_center.alerts._constructor(action=1)
+    with pytest.raises(TypeError):
+        security_center.alerts._constructor(action=[1])
+    with pytest.raises(TypeError):
+        security_center.alerts._constructor(action=[{
+            'type': 'notification',
+            'message': 1
+        }])
+
+
+def test_alerts_constructor_action_unexpectedvalueerror(security_center):
+    '''
+    test alerts constructor for action unexpected value error
+    '''
+    with pytest.raises(UnexpectedValueError):
+        security_center.alerts._constructor(action=[{'message': 'nope'}])
+    with pytest.raises(UnexpectedValueError):
+        security_center.alerts._constructor(action=[{'type': 'something'}])
+
+
 def test_alerts_constructor_success(security_center):
     '''
     test alerts constructor for success
@@ -148,6 +180,79 @@ def test_alerts_constructor(security_center):
     }
 
 
+def test_alerts_max_inflight_typeerror(security_center):
+    '''
+    test alerts for max inflight type error
+    '''
+    with pytest.raises(TypeError):
+        AlertAPI(security_center, max_inflight='eight')
+
+
+def test_alerts_max_inflight_unexpectedvalueerror(security_center):
+    '''
+    test alerts for max inflight unexpected value error
+    '''
+    with pytest.raises(UnexpectedValueError):
+        AlertAPI(security_center, max_inflight=0)
+    with pytest.raises(UnexpectedValueError):
+        AlertAPI(security_center, max_inflight=-1)
+
+
+def test_alerts_max_inflight_platform_option():
+    '''
+    test the max inflight setting is passed through from TenableSC
+    '''
+    with pytest.raises(UnexpectedValueError):
+        TenableSC(url='https://localhost', alert_max_inflight=0)
+    with pytest.raises(TypeError):
+        TenableSC(url='https://localhost', alert_max_inflight='eight')
+    tsc = TenableSC(url='https://localhost', alert_max_inflight=2)
+    assert tsc.alerts._inflight._value == 2
+
+
+@responses.activate
+def test_alerts_inflight_bounding(monkeypatch):
+    '''
+    test alert create & edit calls wait for a free in-flight slot
+    '''
+    responses.add(responses.POST, 'https://localhost/rest/alert',
+                  json={'error_code': 0, 'response': {'id': '1'}})
+    monkeypatch.setattr(AlertAPI, '_inflight_timeout', 0.1)
+    tsc = TenableSC(url='https://localhost', alert_max_inflight=1)
+
+    # with the only slot taken, the create call should time out without
+    # ever reaching the API.
+    tsc.alerts._inflight.acquire()
+    with pytest.raises(TimeoutError):
+        tsc.alerts.create(name='Example')
+    with pytest.raises(TimeoutError):
+        tsc.alerts.edit(1, name='Example')
+    assert len(responses.calls) == 0
+
+    # once the slot is released, the call goes through and releases the slot
+    # when finished.
+    tsc.alerts._inflight.release()
+    assert tsc.alerts.create(name='Example') == {'id': '1'}
+    assert tsc.alerts._inflight.acquire(blocking=False)
+
+
+def test_alerts_json_body():
+    '''
+    test the alert request body serializer
+    '''
+    payload = {'name': 'Example Alert \u2713', 'action': [{'users': [1]}]}
+    body = _json_body(payload)
+    assert isinstance(body, bytes)
+    assert json.loads(body) == payload
+    assert json.loads(_json_body({1: 'a', 'b': None})) == {'1': 'a', 'b': None}
+    for value in [float('nan'), float('inf')]:
+        if alerts_module.orjson:
+            assert json.loads(_json_body({'value': value})) == {'value': None}
+        else:
+            with pytest.raises(ValueError):
+                _json_body({'value': value})
+
+
 def test_alerts_list_fields_typeerror(security_center):
     '''
     test alerts for list fields type error
@@ -156,6 +261,179 @@ def test_alerts_list_fields_typeerror(security_center):
         security_center.alerts.list(fields=1)
 
 
+def test_alerts_list_field_item_typeerror(security_center):
+    '''
+    test alerts for list field item type error
+    '''
+    with pytest.raises(TypeError):
+        security_center.alerts.list(fields=['id', 1])
+
+
+def test_alerts_join_fields():
+    '''
+    test the cached alert fields joiner
+    '''
+    assert _join_fields(('id', 'name')) == 'id,name'
+    assert _join_fields(('id', 'name')) == 'id,name'
+    assert _join_fields.cache_info().hits >= 1
+
+
+def test_alerts_list_limit_typeerror(security_center):
+    '''
+    test alerts for list limit type error
+    '''
+    with pytest.raises(TypeError):
+        security_center.alerts.list(limit='ten')
+
+
+def test_alerts_list_offset_typeerror(security_center):
+    '''
+    test alerts for list offset type error
+    '''
+    with pytest.raises(TypeError):
+        security_center.alerts.list(limit=10, offset='zero')
+
+
+def test_alerts_list_pages_typeerror(security_center):
+    '''
+    test alerts for list pages type error
+    '''
+    with pytest.raises(TypeError):
+        security_center.alerts.list(limit=10, pages='one')
+
+
+@responses.activate
+def test_alerts_list_paginated():
+    '''
+    test alerts for paginated list
+    '''
+    responses.add(responses.GET, 'https://localhost/rest/alert', json={
+        'error_code': 0,
+        'response': {'usable': [], 'manageable': [{'id': '1'}, {'id': '2'}]}
+    })
+    responses.add(responses.GET, 'https://localhost/rest/alert', json={
+        'error_code': 0,
+        'response': {'usable': [], 'manageable': [{'id': '3'}]}
+    })
+    tsc = TenableSC(url='https://localhost')
+    alerts = tsc.alerts.list(limit=2)
+    assert [a['id'] for a in alerts] == ['1', '2', '3']
+    assert len(responses.calls) == 2
+    assert 'startOffset=2' in responses.calls[1].request.url
+    assert 'endOffset=4' in responses.calls[1].request.url
+
+
+@responses.activate
+def test_alerts_iter_list():
+    '''
+    test alerts for the streamed list
+    '''
+    pytest.importorskip('ijson')
+    responses.add(responses.GET, 'https://localhost/rest/alert', json={
+        'error_code': 0,
+        'response': {
+            'usable': [{'id': '3'}],
+            'manageable': [{'id': '1', 'score': 1.5}, {'id': '2'}]
+        }
+    })
+    tsc = TenableSC(url='https://localhost')
+    alerts = list(tsc.alerts.iter_list())
+    assert [a['id'] for a in alerts] == ['1', '2']
+    assert isinstance(alerts[0]['score'], float)
+
+
+@responses.activate
+def test_alerts_details_conditional_get():
+    '''
+    test alerts details for conditional get caching
+    '''
+    responses.add(responses.GET, 'https://localhost/rest/alert/1',
+                  json={'error_code': 0, 'response': {'id': '1'}},
+                  headers={'ETag': '"abc"'})
+    responses.add(responses.GET, 'https://localhost/rest/alert/1', status=304)
+    tsc = TenableSC(url='https://localhost')
+    first = tsc.alerts.details(1)
+    first['id'] = 'modified'
+    second = tsc.alerts.details(1)
+    assert second == {'id': '1'}
+    assert responses.calls[1].request.headers['If-None-Match'] == '"abc"'
+    second['id'] = 'modified'
+    assert tsc.alerts.details(1) == {'id': '1'}
+
+
+@responses.activate
+def test_alerts_details_stale_on_connection_error():
+    '''
+    test alerts details returns the stale copy on a connection error
+    '''
+    responses.add(responses.GET, 'https://localhost/rest/alert/1',
+                  json={'error_code': 0, 'response': {'id': '1'}},
+                  headers={'ETag': '"abc"'})
+    responses.add(responses.GET, 'https://localhost/rest/alert/1',
+                  body=RequestsConnectionError('connection refused'))
+    tsc = TenableSC(url='https://localhost', retries=1)
+    assert tsc.alerts.details(1) == {'id': '1'}
+    assert tsc.alerts.details(1) == {'id': '1'}
+
+    # without a cached copy, the connection error should be raised.
+    responses.add(responses.GET, 'https://localhost/rest/alert/2',
+                  body=RequestsConnectionError('connection refused'))
+    with pytest.raises(RequestsConnectionError):
+        tsc.alerts.details(2)
+
+
+@responses.activate
+def test_alerts_cache_cleared_on_logout():
+    '''
+    test the alert response cache isn't carried across sessions
+    '''
+    responses.add(responses.GET, 'https://localhost/rest/alert/1',
+                  json={'error_code': 0, 'response': {'id': '1'}},
+                  headers={'ETag': '"abc"'})
+    responses.add(responses.GET, 'https://localhost/rest/alert/1',
+                  body=RequestsConnectionError('connection refused'))
+    tsc = TenableSC(url='https://localhost', retries=1)
+    alerts = tsc.alerts
+    assert alerts.details(1) == {'id': '1'}
+    tsc.logout()
+    assert tsc.alerts is not alerts
+    with pytest.raises(RequestsConnectionError):
+        tsc.alerts.details(1)
+
+
+@responses.activate
+def test_alerts_cache_eviction(monkeypatch):
+    '''
+    test the alert response cache evicts the least recently used entries
+    '''
+    monkeypatch.setattr(AlertAPI, '_cache_size', 2)
+    for alert_id in [1, 2, 3]:
+        responses.add(responses.GET,
+                      f'https://localhost/rest/alert/{alert_id}',
+                      json={'error_code': 0, 'response': {'id': alert_id}},
+                      headers={'ETag': f'"{alert_id}"'})
+    tsc = TenableSC(url='https://localhost')
+    for alert_id in [1, 2, 3]:
+        tsc.alerts.details(alert_id)
+    assert [k[0] for k in tsc.alerts._cache] == ['alert/2', 'alert/3']
+
+
+@responses.activate
+def test_alerts_iter_list_error():
+    '''
+    test alerts for an error returned within the streamed list
+    '''
+    pytest.importorskip('ijson')
+    responses.add(responses.GET, 'https://localhost/rest/alert', json={
+        'response': [],
+        'error_code': 146,
+        'error_msg': 'Something went wrong'
+    })
+    tsc = TenableSC(url='https://localhost')
+    with pytest.raises(APIError):
+        list(tsc.alerts.iter_list())
+
+
 @pytest.mark.vcr()
 def test_alerts_list_success(security_center, alert):
     '''
@@ -359,6 +637,43 @@ def test_alerts_create_success(alert):
     check(alert, 'triggerValue', str)
 
 
+@responses.activate
+def test_alerts_details_many():
+    '''
+    test alerts for retrieving multiple alert details
+    '''
+    for alert_id in [1, 2, 3]:
+        responses.add(responses.GET,
+                      f'https://localhost/rest/alert/{alert_id}',
+                      json={'error_code': 0,
+                            'response': {'id': str(alert_id)}})
+    responses.add(responses.GET, 'https://localhost/rest/alert/4',
+                  status=404, json={'error_code': 404, 'error_msg': 'nope'})
+    tsc = TenableSC(url='https://localhost')
+    alerts = tsc.alerts.details_many([3, 1, 2])
+    assert [a['id'] for a in alerts] == ['3', '1', '2']
+    with pytest.raises(APIError):
+        tsc.alerts.details_many([1, 4])
+
+
+def test_alerts_details_many_ids_typeerror(security_center):
+    '''
+    test alerts for 'details many ids' type error
+    '''
+    with pytest.raises(TypeError):
+        security_center.alerts.details_many(1)
+    with pytest.raises(TypeError):
+        security_center.alerts.details_many(['one'])
+
+
+def test_alerts_details_many_num_threads_typeerror(security_center):
+    '''
+    test alerts for 'details many num threads' type error
+    '''
+    with pytest.raises(TypeError):
+        security_center.alerts.details_many([1], num_threads='ten')
+
+
 def test_alerts_edit_id_typerror(security_center):
     '''
     test alerts for 'edit id' type error
@@ -478,6 +793,31 @@ def test_alerts_execute_id_typeerror(security_center):
         security_center.alerts.execute('one')
 
 
+def test_alerts_execute_many_ids_typeerror(security_center):
+    '''
+    test alerts for 'execute many ids' type error
+    '''
+    with pytest.raises(TypeError):
+        security_center.alerts.execute_many(['one'])
+
+
+@responses.activate
+def test_alerts_execute_many():
+    '''
+    test alerts for executing multiple alerts
+    '''
+    responses.add(responses.POST, 'https://localhost/rest/alert/1/execute',
+                  json={'error_code': 0, 'response': {'id': '1'}})
+    responses.add(responses.POST, 'https://localhost/rest/alert/2/execute',
+                  status=404, json={'error_code': 404, 'error_msg': 'nope'})
+    tsc = TenableSC(url='https://localhost', retries=1)
+    results = tsc.alerts.execute_many([1, 2])
+    assert results[0] == {'id': 1, 'status': 'success',
+                          'response': {'id': '1'}}
+    assert results[1]['id'] == 2
+    assert results[1]['status'] == 'error'
+
+
 @pytest.mark.vcr()
 def test_alerts_execute_success(security_center, alert):
     '''